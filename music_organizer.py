@@ -8,13 +8,30 @@ Supports metadata recognition via AcoustID and MusicBrainz for untagged files.
 import os
 import sys
 import argparse
+import asyncio
+import functools
+import hashlib
+import json
 import logging
+import logging.handlers
+import mmap
+import multiprocessing
+import queue
 import shutil
+import sqlite3
 import time
+from dataclasses import asdict, dataclass, field, fields
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 import re
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
 try:
     from mutagen import File as MutagenFile
     from mutagen.id3 import ID3
@@ -23,21 +40,20 @@ try:
     from mutagen.mp4 import MP4
     import acoustid
     import musicbrainzngs
+    import blake3
+    import xxhash
 except ImportError as e:
     print(f"Error: Missing required library: {e}")
     print("Please install required dependencies: pip install -r requirements.txt")
     sys.exit(1)
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('music_organizer.log')
-    ]
-)
+# Logging is configured by setup_logging(): records are queued and a single listener
+# thread writes them to stderr (INFO and up) and music_organizer.log (WARNING and up)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_QUEUE_SIZE = 10000
+_log_queue = queue.Queue(LOG_QUEUE_SIZE)
+_log_handlers: List[logging.Handler] = []
 logger = logging.getLogger(__name__)
 
 # Configure MusicBrainz
@@ -45,16 +61,453 @@ musicbrainzngs.set_useragent("MusicOrganizerTool", "1.0", "https://github.com/yo
 
 # Supported audio file extensions
 AUDIO_EXTENSIONS = {'.mp3', '.flac', '.m4a', '.mp4', '.ogg', '.opus', '.wma', '.wav', '.aac'}
+AUDIO_SUFFIXES = tuple(AUDIO_EXTENSIONS)  # For str.endswith, which tests a tuple in C
 
 # Supported image file extensions for album art
 IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
 
+# Files between progress log lines
+PROGRESS_LOG_INTERVAL = 500
+
+# Maximum number of copies/moves in flight at once (also caps open file descriptors)
+MAX_CONCURRENT_TRANSFERS = 64
+
+# Files smaller than this are memory-mapped for tag reading; larger ones (e.g. long WAVs) are read normally
+MMAP_MAX_SIZE = 100 * 1024 * 1024
+
+# Leading bytes prefetched before tag reading (ID3v2 / FLAC metadata blocks live here)
+HEADER_PREFETCH_SIZE = 64 * 1024
+
+# Files whose headers are prefetched ahead of the one being processed
+PREFETCH_DEPTH = 2
+
+# Bytes hashed from each end of a file when comparing content for collisions
+CONTENT_SAMPLE_SIZE = 64 * 1024
+
+# Files allowed directly in unorganized/ before new files are sharded into hashed subfolders
+DEFAULT_SHARD_THRESHOLD = 256
+
+# AcoustID allows 3 requests per second per API key
+ACOUSTID_RATE_LIMIT = 3
+
+# Number of recordings resolved per MusicBrainz search request
+MUSICBRAINZ_BATCH_SIZE = 50
+
+# Default location of the persistent AcoustID/MusicBrainz lookup cache
+DEFAULT_ACOUSTID_CACHE = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'music_organizer' / 'acoustid.db'
+
+
+# Tag keys probed for each metadata field, in priority order
+_ARTIST_KEYS = ('artist', 'albumartist', 'TPE1', 'TPE2', '©ART', 'ARTIST')
+_ALBUM_KEYS = ('album', 'TALB', '©alb', 'ALBUM')
+_TITLE_KEYS = ('title', 'TIT2', '©nam', 'TITLE')
+_TRACK_KEYS = ('tracknumber', 'TRCK', 'trkn', 'TRACKNUMBER')
+_TAG_KEYS = (
+    ('artist', _ARTIST_KEYS),
+    ('album', _ALBUM_KEYS),
+    ('title', _TITLE_KEYS),
+    ('track', _TRACK_KEYS)
+)
+
+# Leading bytes of the audio containers we handle: ID3-tagged or raw MPEG/ADTS frames,
+# FLAC, Ogg (Vorbis/Opus), RIFF/WAVE, MP4/M4A and ASF (WMA)
+_AUDIO_MAGIC = re.compile(
+    rb'ID3|\xff[\xe0-\xff]|fLaC|OggS|RIFF.{4}WAVE|.{4}ftyp|\x30\x26\xb2\x75\x8e\x66\xcf\x11',
+    re.DOTALL
+)
+AUDIO_MAGIC_SIZE = 12
+
+# Characters that are not allowed in file names, as a str.translate deletion table
+_INVALID_FILENAME_CHARS = {ord(c): None for c in '<>:"/\\|?*'}
+
+# Runs of whitespace collapsed to a single space in file names
+_WHITESPACE_RUN = re.compile(r'\s+')
+
+# Linux ioctl that clones a file's extents (reflink) on copy-on-write filesystems
+FICLONE = 0x40049409
+
+
+class _BlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that waits for room instead of dropping records when the queue is full."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put(record)
+
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Route all logging through a bounded queue drained by one listener thread.
+
+    Returns:
+        The started listener; stop it before exiting to flush pending records
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    console_handler = logging.StreamHandler()
+    file_handler = logging.FileHandler('music_organizer.log')
+    file_handler.setLevel(logging.WARNING)
+    for handler in (console_handler, file_handler):
+        handler.setFormatter(formatter)
+    _log_handlers[:] = [console_handler, file_handler]
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.handlers = [_BlockingQueueHandler(_log_queue)]
+
+    listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def flush_logs() -> None:
+    """Wait until the listener has written every queued log record."""
+    _log_queue.join()
+
+
+class _NamedMmap(mmap.mmap):
+    """Read-only mapping that carries the file name, so mutagen can still score formats by extension."""
+
+    name: str
+
+
+def _prefetch_header(fd: int) -> None:
+    """Ask the kernel to start reading the first HEADER_PREFETCH_SIZE bytes, where tags usually live."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, HEADER_PREFETCH_SIZE, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+
+
+def _try_reflink(src_fd: int, dst_fd: int) -> bool:
+    """Clone src_fd into dst_fd with the FICLONE ioctl, returning False if unsupported."""
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except OSError:
+        return False
+
+
+def _try_copy_file_range(src_fd: int, dst_fd: int) -> bool:
+    """
+    Copy src_fd into dst_fd in the kernel with copy_file_range.
+
+    Returns False if unsupported or incomplete: some filesystems (FUSE, network,
+    virtual) return 0 instead of copying, and the caller must then fall back.
+    """
+    if not hasattr(os, 'copy_file_range'):
+        return False
+    remaining = os.fstat(src_fd).st_size
+    try:
+        while remaining > 0:
+            copied = os.copy_file_range(src_fd, dst_fd, remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+    except OSError:
+        return False
+    return remaining == 0
+
+
+def _fast_copy(src: str, dst: str) -> str:
+    """
+    Copy a file with its metadata, cloning it where the filesystem allows.
+
+    Tries a reflink first (O(1) on btrfs/XFS/ZFS), then copy_file_range, and
+    falls back to shutil.copy2.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        The destination path, so it can be used as a shutil.move copy_function
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        copied = _try_reflink(fsrc.fileno(), fdst.fileno()) or \
+            _try_copy_file_range(fsrc.fileno(), fdst.fileno())
+    if copied:
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _first_tag(tags, keys: Tuple[str, ...]) -> Optional[str]:
+    """
+    Return the first of keys present in a mutagen tag container, as a string.
+
+    A single item lookup per key replaces the `in` check plus lookup; keys the
+    container rejects outright (e.g. '©ART' on Vorbis comments) are skipped.
+
+    Args:
+        tags: Mutagen tags object
+        keys: Candidate tag keys in priority order
+
+    Returns:
+        The tag value, or None if no key is present
+    """
+    for key in keys:
+        try:
+            value = tags[key]
+        except (KeyError, ValueError):
+            continue
+        return str(value[0]) if isinstance(value, list) else str(value)
+    return None
+
+
+def _has_audio_stream(path: Path) -> bool:
+    """
+    Cheaply check a file's leading magic bytes for a known audio container,
+    so corrupt or mislabelled files are rejected before fingerprinting.
+
+    Args:
+        path: Audio file path
+
+    Returns:
+        True if the header looks like audio
+    """
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(AUDIO_MAGIC_SIZE)
+    except OSError:
+        return False
+    return _AUDIO_MAGIC.match(header) is not None
+
+
+def _warm_header(path: str) -> None:
+    """
+    Read a file's first HEADER_PREFETCH_SIZE bytes so they are in the page cache
+    by the time the file is processed. Errors are left for the real read to report.
+
+    Args:
+        path: File to warm
+    """
+    try:
+        with open(path, 'rb') as f:
+            _prefetch_header(f.fileno())
+            f.read(HEADER_PREFETCH_SIZE)
+    except OSError:
+        pass
+
+
+def _same_file(path_a: Path, path_b: Path) -> bool:
+    """
+    Check whether two paths name the same existing file, by device and inode.
+
+    The second path is stat'ed first, so a missing destination costs one syscall.
+
+    Args:
+        path_a: First path
+        path_b: Second path
+
+    Returns:
+        True if both paths exist and refer to the same file
+    """
+    try:
+        stat_b = os.stat(path_b)
+        stat_a = os.stat(path_a)
+    except OSError:
+        return False
+    return (stat_a.st_dev, stat_a.st_ino) == (stat_b.st_dev, stat_b.st_ino)
+
+
+def _sample_digest(path: Path) -> int:
+    """
+    Hash the first and last CONTENT_SAMPLE_SIZE bytes of a file with xxh3.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        64-bit digest of the sampled bytes
+    """
+    hasher = xxhash.xxh3_64()
+    with open(path, 'rb') as f:
+        hasher.update(f.read(CONTENT_SAMPLE_SIZE))
+        size = os.fstat(f.fileno()).st_size
+        if size > 2 * CONTENT_SAMPLE_SIZE:
+            f.seek(-CONTENT_SAMPLE_SIZE, os.SEEK_END)
+        hasher.update(f.read())
+    return hasher.intdigest()
+
+
+def _same_content(path_a: Path, path_b: Path) -> bool:
+    """
+    Check whether two files are (almost certainly) identical: same size and same sampled digest.
+
+    Args:
+        path_a: First file
+        path_b: Second file
+
+    Returns:
+        True if the files match
+    """
+    try:
+        if path_a.stat().st_size != path_b.stat().st_size:
+            return False
+        return _sample_digest(path_a) == _sample_digest(path_b)
+    except OSError:
+        return False
+
+
+def _content_hash(path: Path) -> str:
+    """
+    Hash a file's full content with blake3, reading it through a memory map.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        First 16 hex digits of the digest
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return blake3.blake3().hexdigest()[:16]
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return blake3.blake3(mapped).hexdigest()[:16]
+
+
+@dataclass
+class Stats:
+    """Run statistics. Field order and labels drive the printed summary."""
+
+    total_files: int = field(default=0, metadata={'label': 'Total files processed'})
+    organized: int = field(default=0, metadata={'label': 'Successfully organized'})
+    unorganized: int = field(default=0, metadata={'label': 'Moved to unorganized/'})
+    skipped: int = field(default=0, metadata={'label': 'Already in correct location (skipped)'})
+    duplicates: int = field(default=0, metadata={'label': 'Duplicates skipped'})
+    album_art_copied: int = field(default=0, metadata={'label': 'Album art copied'})
+    metadata_found: int = field(default=0, metadata={'label': 'Metadata found via AcoustID'})
+    errors: int = field(default=0, metadata={'label': 'Errors'})
+
+    def __add__(self, other: 'Stats') -> 'Stats':
+        return Stats(*(getattr(self, f.name) + getattr(other, f.name) for f in fields(Stats)))
+
+    def __iadd__(self, other: 'Stats') -> 'Stats':
+        for f in fields(Stats):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+        return self
+
+
+class TokenBucket:
+    """Token-bucket rate limiter whose state lives in shared memory, so worker processes draw from one bucket."""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = multiprocessing.Value('d', capacity)
+        self._updated = multiprocessing.Value('d', time.monotonic(), lock=False)
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._tokens.get_lock():
+                now = time.monotonic()
+                tokens = min(self.capacity, self._tokens.value + (now - self._updated.value) * self.rate)
+                self._updated.value = now
+                if tokens >= 1:
+                    self._tokens.value = tokens - 1
+                    return
+                self._tokens.value = tokens
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
+
+
+class AcoustIDCache:
+    """Persistent SQLite cache of AcoustID/MusicBrainz matches keyed by audio fingerprint."""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the cache. The database is opened lazily so each worker process gets its own connection.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self._conn = None
+        self._memory = {}  # In-process hot set in front of the database
+
+    @staticmethod
+    def make_key(file_size: int, fingerprint: bytes) -> str:
+        """
+        Build a cache key from the file size and its Chromaprint fingerprint.
+
+        Args:
+            file_size: Size of the audio file in bytes
+            fingerprint: Chromaprint fingerprint from acoustid.fingerprint_file
+
+        Returns:
+            Cache key string
+        """
+        if isinstance(fingerprint, str):
+            fingerprint = fingerprint.encode()
+        return f"{file_size}:{hashlib.sha1(fingerprint).hexdigest()}"
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating it if needed."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), timeout=30)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS matches (key TEXT PRIMARY KEY, metadata TEXT NOT NULL)')
+        return self._conn
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """
+        Look up a cached match.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Dictionary with title, artist, album and recording_id, or None on a miss
+        """
+        if key in self._memory:
+            return self._memory[key]
+        try:
+            row = self._connect().execute('SELECT metadata FROM matches WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading AcoustID cache {self.db_path}: {e}")
+            return None
+        if row is None:
+            return None
+        self._memory[key] = json.loads(row[0])
+        return self._memory[key]
+
+    def put(self, key: str, metadata: Dict[str, str]) -> None:
+        """
+        Store a match in the cache.
+
+        Args:
+            key: Cache key from make_key
+            metadata: Dictionary with title, artist, album and recording_id
+        """
+        self._memory[key] = metadata
+        try:
+            with self._connect() as conn:
+                conn.execute('INSERT OR REPLACE INTO matches (key, metadata) VALUES (?, ?)',
+                             (key, json.dumps(metadata)))
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing AcoustID cache {self.db_path}: {e}")
+
 
 class MusicOrganizer:
     """Main class for organizing music files."""
 
     def __init__(self, source_dir: str, dest_dir: str, dry_run: bool = False,
-                 acoustid_api_key: Optional[str] = None, move_files: bool = False):
+                 acoustid_api_key: Optional[str] = None, move_files: bool = False,
+                 workers: Optional[int] = None, acoustid_bucket: Optional['TokenBucket'] = None,
+                 acoustid_cache_path: Optional[str] = None, reflink: bool = False,
+                 shard_threshold: int = DEFAULT_SHARD_THRESHOLD):
         """
         Initialize the Music Organizer.
 
@@ -64,21 +517,54 @@ class MusicOrganizer:
             dry_run: If True, preview changes without making them
             acoustid_api_key: API key for AcoustID service (optional)
             move_files: If True, move files instead of copying them (for in-place reorganization)
+            workers: Number of worker processes (defaults to the CPU count, 1 disables the pool)
+            acoustid_bucket: Rate limiter shared between processes for AcoustID requests
+            acoustid_cache_path: Path of the persistent AcoustID lookup cache (optional)
+            reflink: If True, clone files on copy-on-write filesystems instead of copying data
+            shard_threshold: Files allowed directly in unorganized/ before files go into hashed subfolders (0 disables)
         """
         self.source_dir = Path(source_dir).resolve()
         self.dest_dir = Path(dest_dir).resolve()
+        self._dest_dir_str = str(self.dest_dir)
+        self._album_dirs = {}  # (artist, album) tag values -> destination album directory string
         self.dry_run = dry_run
         self.acoustid_api_key = acoustid_api_key
         self.move_files = move_files
+        self.copy_function = _fast_copy if reflink else shutil.copy2
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.acoustid_bucket = acoustid_bucket or TokenBucket(ACOUSTID_RATE_LIMIT, ACOUSTID_RATE_LIMIT)
+        self.acoustid_cache = AcoustIDCache(acoustid_cache_path or DEFAULT_ACOUSTID_CACHE)
+        # Saved transfer plan of an in-progress run, kept next to the cache
+        run_key = hashlib.sha1(f"{self.source_dir}|{self.dest_dir}".encode()).hexdigest()[:16]
+        self.plan_path = self.acoustid_cache.db_path.parent / f'plan-{run_key}.json'
         self.processed_album_art_dirs = set()  # Track dirs we've already processed album art for
-        self.stats = {
-            'total_files': 0,
-            'organized': 0,
-            'unorganized': 0,
-            'metadata_found': 0,
-            'errors': 0,
-            'skipped': 0,
-            'album_art_copied': 0
+        self.shard_threshold = shard_threshold
+        self._unorganized_count = None  # Files directly in unorganized/, counted lazily
+        self.album_art_state = {}  # dest_album_dir -> 'done' (has cover) or 'missing' (probed, none yet)
+        self.pending_lookups = []  # (file, metadata, recording_id, cache_key) awaiting a MusicBrainz album
+        self.pending_transfers = []  # (source, destination) pairs awaiting claim_transfers()
+        self.pending_album_art = []  # (source_dir, dest_album_dir) pairs handled after the transfers
+        self._seen_samples = {}  # (size, sampled digest) -> first source with them, None once hashed
+        self._seen_hashes = {}  # content hash -> first source claimed with it (the canonical copy)
+        self.stats = Stats()
+
+    def worker_config(self) -> Dict:
+        """
+        Return the constructor arguments needed to rebuild this organizer in a worker process.
+
+        Returns:
+            Dictionary of picklable keyword arguments
+        """
+        return {
+            'source_dir': str(self.source_dir),
+            'dest_dir': str(self.dest_dir),
+            'dry_run': self.dry_run,
+            'acoustid_api_key': self.acoustid_api_key,
+            'move_files': self.move_files,
+            'workers': 1,
+            'acoustid_cache_path': str(self.acoustid_cache.db_path),
+            'reflink': self.copy_function is _fast_copy,
+            'shard_threshold': self.shard_threshold
         }
 
     def sanitize_filename(self, name: str) -> str:
@@ -92,9 +578,9 @@ class MusicOrganizer:
             Sanitized filename
         """
         # Remove invalid characters
-        name = re.sub(r'[<>:"/\\|?*]', '', name)
+        name = name.translate(_INVALID_FILENAME_CHARS)
         # Replace multiple spaces with single space
-        name = re.sub(r'\s+', ' ', name)
+        name = _WHITESPACE_RUN.sub(' ', name)
         # Strip leading/trailing whitespace and dots
         name = name.strip('. ')
         # Limit length
@@ -102,50 +588,36 @@ class MusicOrganizer:
             name = name[:200]
         return name if name else 'Unknown'
 
-    def get_metadata(self, file_path: Path) -> Dict[str, str]:
+    def get_metadata(self, file_path: Path, fileobj: Optional[Union[BinaryIO, mmap.mmap]] = None) -> Dict[str, str]:
         """
         Extract metadata from audio file.
 
         Args:
             file_path: Path to audio file
+            fileobj: Already-open binary handle or mapping of file_path (optional)
 
         Returns:
             Dictionary with artist, album, title, track number
         """
         try:
-            audio = MutagenFile(str(file_path), easy=True)
+            audio = MutagenFile(fileobj if fileobj is not None else str(file_path), easy=True)
             if audio is None:
                 return {}
 
+            tags = audio.tags
+            if not tags:
+                return {}
+
+            # Probe each tag once per key (works for most formats via mutagen's easy interface)
             metadata = {}
+            for name, keys in _TAG_KEYS:
+                value = _first_tag(tags, keys)
+                if value is not None:
+                    metadata[name] = value
 
-            # Try to get common tags (works for most formats via mutagen's easy interface)
-            if hasattr(audio, 'tags') and audio.tags:
-                # Get artist
-                for key in ['artist', 'albumartist', 'TPE1', 'TPE2', '©ART', 'ARTIST']:
-                    if key in audio:
-                        metadata['artist'] = str(audio[key][0]) if isinstance(audio[key], list) else str(audio[key])
-                        break
-
-                # Get album
-                for key in ['album', 'TALB', '©alb', 'ALBUM']:
-                    if key in audio:
-                        metadata['album'] = str(audio[key][0]) if isinstance(audio[key], list) else str(audio[key])
-                        break
-
-                # Get title
-                for key in ['title', 'TIT2', '©nam', 'TITLE']:
-                    if key in audio:
-                        metadata['title'] = str(audio[key][0]) if isinstance(audio[key], list) else str(audio[key])
-                        break
-
-                # Get track number
-                for key in ['tracknumber', 'TRCK', 'trkn', 'TRACKNUMBER']:
-                    if key in audio:
-                        track = str(audio[key][0]) if isinstance(audio[key], list) else str(audio[key])
-                        # Extract just the number if it's in format "1/10"
-                        metadata['track'] = track.split('/')[0].zfill(2)
-                        break
+            if 'track' in metadata:
+                # Extract just the number if it's in format "1/10"
+                metadata['track'] = metadata['track'].split('/')[0].zfill(2)
 
             return metadata
 
@@ -153,62 +625,153 @@ class MusicOrganizer:
             logger.warning(f"Error reading metadata from {file_path}: {e}")
             return {}
 
-    def get_metadata_from_acoustid(self, file_path: Path) -> Optional[Dict[str, str]]:
+    def get_metadata_from_acoustid(self, file_path: Path,
+                                   file_size: Optional[int] = None) -> Optional[Dict[str, str]]:
         """
-        Try to identify audio file using AcoustID and MusicBrainz.
+        Try to identify audio file using AcoustID, answering from the cache when possible.
 
         Args:
             file_path: Path to audio file
+            file_size: Size of the file in bytes, if already known
 
         Returns:
-            Dictionary with metadata or None if not found
+            Dictionary with metadata or None if not found. A fresh (uncached) match also
+            carries 'recording_id' and 'cache_key' and still needs its album resolved.
         """
         if not self.acoustid_api_key:
             logger.debug("AcoustID API key not provided, skipping acoustic fingerprinting")
             return None
 
+        if not _has_audio_stream(file_path):
+            logger.info(f"No recognizable audio stream in {file_path.name}, skipping AcoustID")
+            return None
+
         try:
             logger.info(f"Attempting to identify {file_path.name} using AcoustID...")
 
-            # Get acoustic fingerprint and duration
-            results = acoustid.match(self.acoustid_api_key, str(file_path))
+            # Fingerprint locally first; only a cache miss needs the (rate-limited) network
+            duration, fingerprint = acoustid.fingerprint_file(str(file_path))
+            if file_size is None:
+                file_size = file_path.stat().st_size
+            cache_key = AcoustIDCache.make_key(file_size, fingerprint)
 
-            for score, recording_id, title, artist in results:
-                if score > 0.5:  # Confidence threshold
-                    logger.info(f"Match found with {score:.0%} confidence: {artist} - {title}")
+            cached = self.acoustid_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached match: {cached['artist']} - {cached['title']}")
+                self.stats.metadata_found += 1
+                return {k: cached[k] for k in ('title', 'artist', 'album') if cached.get(k)}
 
-                    # Try to get more metadata from MusicBrainz
-                    try:
-                        recording = musicbrainzngs.get_recording_by_id(
-                            recording_id,
-                            includes=['artists', 'releases']
-                        )
+            # Only a real request draws from the bucket shared by all workers
+            self.acoustid_bucket.acquire()
+            return self._lookup_acoustid(file_path, duration, fingerprint, cache_key)
 
-                        metadata = {
-                            'title': title,
-                            'artist': artist
-                        }
+        except Exception as e:
+            logger.warning(f"Error identifying {file_path}: {e}")
+            return None
 
-                        # Get album from first release
-                        if 'release-list' in recording['recording']:
-                            releases = recording['recording']['release-list']
-                            if releases:
-                                metadata['album'] = releases[0]['title']
+    def _lookup_acoustid(self, file_path: Path, duration: float, fingerprint: bytes,
+                         cache_key: str) -> Optional[Dict[str, str]]:
+        """
+        Query AcoustID for a fingerprint.
 
-                        self.stats['metadata_found'] += 1
-                        return metadata
+        The album is not known yet: the returned recording_id is resolved against
+        MusicBrainz in a batch once every file has been fingerprinted.
 
-                    except Exception as e:
-                        logger.warning(f"Error fetching MusicBrainz data: {e}")
-                        # Return what we have
-                        return {'title': title, 'artist': artist}
+        Args:
+            file_path: Path to audio file
+            duration: Track duration in seconds
+            fingerprint: Chromaprint fingerprint of the file
+            cache_key: Key to store the match under in the AcoustID cache
 
-            logger.info(f"No confident match found for {file_path.name}")
-            return None
+        Returns:
+            Dictionary with title, artist, recording_id and cache_key, or None if not found
+        """
+        response = acoustid.lookup(self.acoustid_api_key, fingerprint, duration)
+        results = acoustid.parse_lookup_result(response)
+
+        for score, recording_id, title, artist in results:
+            if score > 0.5:  # Confidence threshold
+                logger.info(f"Match found with {score:.0%} confidence: {artist} - {title}")
+                return {
+                    'title': title,
+                    'artist': artist,
+                    'recording_id': recording_id,
+                    'cache_key': cache_key
+                }
+
+        logger.info(f"No confident match found for {file_path.name}")
+        return None
+
+    def resolve_recording_albums(self, recording_ids: List[str]) -> Dict[str, str]:
+        """
+        Look up the album of many MusicBrainz recordings with as few requests as possible.
 
-        except Exception as e:
-            logger.warning(f"Error identifying {file_path}: {e}")
-            return None
+        Recordings are fetched MUSICBRAINZ_BATCH_SIZE at a time through a single
+        search query; any the search index does not return are fetched one by one.
+
+        Args:
+            recording_ids: MusicBrainz recording IDs
+
+        Returns:
+            Dictionary mapping recording ID to album title
+        """
+        albums = {}
+        unique_ids = list(dict.fromkeys(recording_ids))
+
+        for i in range(0, len(unique_ids), MUSICBRAINZ_BATCH_SIZE):
+            batch = unique_ids[i:i + MUSICBRAINZ_BATCH_SIZE]
+            try:
+                result = musicbrainzngs.search_recordings(
+                    query=' OR '.join(f'rid:{recording_id}' for recording_id in batch),
+                    limit=len(batch)
+                )
+                for recording in result.get('recording-list', []):
+                    releases = recording.get('release-list')
+                    if recording['id'] in batch and releases:
+                        albums[recording['id']] = releases[0]['title']
+            except Exception as e:
+                logger.warning(f"Error fetching MusicBrainz data: {e}")
+
+        for recording_id in unique_ids:
+            if recording_id in albums:
+                continue
+            try:
+                recording = musicbrainzngs.get_recording_by_id(
+                    recording_id,
+                    includes=['artists', 'releases']
+                )
+                # Get album from first release
+                releases = recording['recording'].get('release-list')
+                if releases:
+                    albums[recording_id] = releases[0]['title']
+            except Exception as e:
+                logger.warning(f"Error fetching MusicBrainz data: {e}")
+
+        return albums
+
+    def resolve_pending_lookups(self) -> None:
+        """
+        Fill in the album of every AcoustID match in one batched MusicBrainz pass.
+        The metadata dictionaries of the pending lookups are updated in place.
+        """
+        if not self.pending_lookups:
+            return
+
+        logger.info(f"Resolving {len(self.pending_lookups)} AcoustID matches against MusicBrainz...")
+        albums = self.resolve_recording_albums([lookup[2] for lookup in self.pending_lookups])
+
+        for _, metadata, recording_id, cache_key in self.pending_lookups:
+            if recording_id in albums:
+                metadata['album'] = albums[recording_id]
+                self.acoustid_cache.put(cache_key, {
+                    'title': metadata['title'],
+                    'artist': metadata['artist'],
+                    'album': metadata['album'],
+                    'recording_id': recording_id
+                })
+                self.stats.metadata_found += 1
+
+        self.pending_lookups = []
 
     def get_destination_path(self, file_path: Path, metadata: Dict[str, str]) -> Path:
         """
@@ -223,8 +786,13 @@ class MusicOrganizer:
         """
         # Check if we have enough metadata
         if 'artist' in metadata and 'album' in metadata and 'title' in metadata:
-            artist = self.sanitize_filename(metadata['artist'])
-            album = self.sanitize_filename(metadata['album'])
+            # Tracks of one album share the sanitized Artist/Album directory string
+            album_key = (metadata['artist'], metadata['album'])
+            album_dir = self._album_dirs.get(album_key)
+            if album_dir is None:
+                artist = self.sanitize_filename(metadata['artist'])
+                album = self.sanitize_filename(metadata['album'])
+                album_dir = self._album_dirs[album_key] = f"{self._dest_dir_str}{os.sep}{artist}{os.sep}{album}"
             title = self.sanitize_filename(metadata['title'])
 
             # Build filename with track number if available
@@ -233,15 +801,45 @@ class MusicOrganizer:
             else:
                 filename = f"{title}{file_path.suffix}"
 
-            # Build path: Artist/Album/Track
-            dest_path = self.dest_dir / artist / album / filename
+            # Build path: Artist/Album/Track as one string, parsed into a single Path
+            dest_path = Path(f"{album_dir}{os.sep}{filename}")
 
         else:
-            # Not enough metadata, put in unorganized folder
+            # Not enough metadata, put in unorganized folder (claim_transfers() may shard it)
             dest_path = self.dest_dir / 'unorganized' / file_path.name
 
         return dest_path
 
+    def _unorganized_destination(self, file_path: Path, flat_path: Path) -> Path:
+        """
+        Place a file in unorganized/ directly, or in a hashed subfolder (e.g. 'ab/cd')
+        once unorganized/ holds shard_threshold files.
+
+        A file already stored flat from an earlier run keeps that place, so re-runs
+        neither copy it again nor move it into a shard.
+
+        Args:
+            file_path: Source path
+            flat_path: The file's path directly inside unorganized/
+
+        Returns:
+            Destination path to resolve collisions against
+        """
+        if not self.shard_threshold:
+            return flat_path
+        if self._unorganized_count is None:
+            try:
+                with os.scandir(flat_path.parent) as entries:
+                    self._unorganized_count = sum(1 for entry in entries if entry.is_file())
+            except OSError:
+                self._unorganized_count = 0
+        if self._unorganized_count < self.shard_threshold:
+            return flat_path
+        if _same_file(file_path, flat_path) or (flat_path.exists() and _same_content(file_path, flat_path)):
+            return flat_path
+        digest = hashlib.blake2b(flat_path.name.encode(), digest_size=2).hexdigest()
+        return flat_path.parent / digest[:2] / digest[2:] / flat_path.name
+
     def copy_album_art(self, source_dir: Path, dest_album_dir: Path) -> None:
         """
         Copy album art from source directory to destination album directory.
@@ -250,25 +848,29 @@ class MusicOrganizer:
             source_dir: Source directory containing the original audio file
             dest_album_dir: Destination album directory where art should be copied
         """
-        # Skip if we've already processed this source directory
-        source_dir_key = str(source_dir.resolve())
+        # Skip if we've already processed this source directory. Scanned paths all live
+        # under the resolved source_dir, so the string is already canonical.
+        source_dir_key = str(source_dir)
         if source_dir_key in self.processed_album_art_dirs:
             return
 
         # Mark this directory as processed
         self.processed_album_art_dirs.add(source_dir_key)
 
-        # Check if destination already has cover art
-        existing_cover = None
-        for ext in ['.jpg', '.jpeg', '.png']:
-            potential_cover = dest_album_dir / f'cover{ext}'
-            if potential_cover.exists():
-                existing_cover = potential_cover
-                break
-
-        if existing_cover:
-            logger.debug(f"Album art already exists at {existing_cover}, skipping")
+        # Check if destination already has cover art, probing each album directory only once
+        dest_key = str(dest_album_dir)
+        state = self.album_art_state.get(dest_key)
+        if state == 'done':
+            logger.debug(f"Album art already handled for {dest_album_dir}, skipping")
             return
+        if state is None:
+            for ext in ['.jpg', '.jpeg', '.png']:
+                potential_cover = dest_album_dir / f'cover{ext}'
+                if potential_cover.exists():
+                    self.album_art_state[dest_key] = 'done'
+                    logger.debug(f"Album art already exists at {potential_cover}, skipping")
+                    return
+            self.album_art_state[dest_key] = 'missing'
 
         # Look for image files in source directory
         image_files = []
@@ -294,120 +896,562 @@ class MusicOrganizer:
         # Copy the image
         if self.dry_run:
             logger.info(f"[DRY RUN] Would copy album art: {source_image} -> {dest_image}")
+            self.album_art_state[dest_key] = 'done'
         else:
             try:
                 if self.move_files:
-                    shutil.copy2(str(source_image), str(dest_image))
+                    self.copy_function(str(source_image), str(dest_image))
                     logger.info(f"Copied album art: {source_image.name} -> {dest_image}")
                 else:
-                    shutil.copy2(str(source_image), str(dest_image))
+                    self.copy_function(str(source_image), str(dest_image))
                     logger.info(f"Copied album art: {source_image.name} -> {dest_image}")
-                self.stats['album_art_copied'] += 1
+                self.album_art_state[dest_key] = 'done'
+                self.stats.album_art_copied += 1
             except Exception as e:
                 logger.warning(f"Error copying album art from {source_image}: {e}")
 
-    def organize_file(self, file_path: Path) -> bool:
+    def read_file_tags(self, file_path: str) -> Optional[Tuple[str, Dict[str, str], int]]:
         """
-        Organize a single music file.
+        Read the tags of a single music file.
 
         Args:
             file_path: Path to music file
 
         Returns:
-            True if successfully organized, False otherwise
+            (file_path, metadata, file_size) record, or None if the file could not be read
         """
         try:
-            logger.info(f"Processing: {file_path}")
+            logger.debug(f"Processing: {file_path}")
+
+            # Open the file once: mutagen parses tags from this handle and the size comes from fstat
+            with open(file_path, 'rb') as fileobj:
+                file_size = os.fstat(fileobj.fileno()).st_size
+                if 0 < file_size < MMAP_MAX_SIZE:
+                    # Map the file so only the pages mutagen touches (tags, stream info) are read
+                    with _NamedMmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        mapped.name = file_path
+                        metadata = self.get_metadata(Path(file_path), mapped)
+                else:
+                    metadata = self.get_metadata(Path(file_path), fileobj)
+            return file_path, metadata, file_size
+
+        except Exception as e:
+            logger.error(f"Error organizing {file_path}: {e}")
+            self.stats.errors += 1
+            return None
+
+    def identify_file(self, candidate: Tuple[str, int]) -> Tuple[str, Optional[Dict[str, str]]]:
+        """
+        Identify a single music file with insufficient tags using AcoustID.
+
+        Args:
+            candidate: (file_path, file_size) pair
+
+        Returns:
+            (file_path, metadata) pair; metadata is None if the file was not identified
+        """
+        file_path, file_size = candidate
+        logger.info(f"Insufficient metadata in {file_path}, trying AcoustID...")
+        return file_path, self.get_metadata_from_acoustid(Path(file_path), file_size)
 
-            # Get metadata from file
-            metadata = self.get_metadata(file_path)
+    def plan_file(self, file_path: Path, metadata: Dict[str, str]) -> bool:
+        """
+        Queue a file for transfer to the destination its metadata dictates.
 
-            # If metadata is insufficient, try AcoustID
-            if not all(k in metadata for k in ['artist', 'album', 'title']):
-                logger.info(f"Insufficient metadata in file, trying AcoustID...")
-                acoustid_metadata = self.get_metadata_from_acoustid(file_path)
-                time.sleep(0.33)
-                if acoustid_metadata:
-                    metadata.update(acoustid_metadata)
+        Args:
+            file_path: Path to music file
+            metadata: Metadata dictionary
 
+        Returns:
+            True if the file was queued or skipped, False on error
+        """
+        try:
             # Determine destination
             dest_path = self.get_destination_path(file_path, metadata)
 
             # Check if file is already in the correct location
-            if file_path.resolve() == dest_path.resolve():
+            # source_dir/dest_dir are resolved once in __init__, so equal strings are the
+            # common in-place case; otherwise compare file identity instead of resolving
+            if str(file_path) == str(dest_path) or _same_file(file_path, dest_path):
                 logger.info(f"File already in correct location: {file_path}")
-                self.stats['skipped'] += 1
+                self.stats.skipped += 1
                 return True
 
-            # In copy mode, skip if destination file already exists
-            if not self.move_files and dest_path.exists():
-                logger.info(f"File already exists at destination, skipping: {dest_path}")
-                self.stats['skipped'] += 1
-                return True
+            # Defer the actual copy/move (and collision handling) to claim_transfers()
+            self.pending_transfers.append((file_path, dest_path))
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error organizing {file_path}: {e}")
+            self.stats.errors += 1
+            return False
+
+    def claim_transfers(self) -> List[Tuple[Path, Path]]:
+        """
+        Accept the queued transfers, resolving destination collisions by content.
+
+        Sources with identical content are transferred once: only files that share
+        their size and sampled digest with another queued file get a full blake3
+        hash, and later copies are skipped in favour of the first. A destination
+        that already exists is compared by size and sampled digest and skipped if
+        identical; any other collision, including one with a file claimed earlier
+        in this run (compared case-insensitively), gets a " (2)", " (3)", ...
+        suffix. Duplicates are never moved or deleted, so in move mode they stay
+        in the source tree. Concurrent copies/moves therefore never race on one
+        target, even on case-insensitive filesystems, and never overwrite a
+        different file.
+
+        Returns:
+            List of (source, destination) pairs to transfer
+        """
+        sizes = {}
+        for file_path, _ in self.pending_transfers:
+            try:
+                sizes[file_path] = file_path.stat().st_size
+            except OSError:
+                pass
+        size_counts = Counter(sizes.values())
+
+        claimed = {}  # case-folded destination -> source claimed this run
+        transfers = []
+        action_verb = "move" if self.move_files else "copy"
+        unorganized_dir = self.dest_dir / 'unorganized'
+        for file_path, dest_path in self.pending_transfers:
+            if size_counts[sizes.get(file_path)] > 1:
+                canonical = self._claim_content(file_path, sizes[file_path])
+                if canonical is not None:
+                    logger.info(f"Duplicate of {canonical}, skipping: {file_path}")
+                    self.stats.duplicates += 1
+                    continue
+
+            if dest_path.parent == unorganized_dir:
+                dest_path = self._unorganized_destination(file_path, dest_path)
+            dest_path = self._resolve_collision(file_path, dest_path, claimed)
+            if dest_path is None:
+                continue
+            if dest_path.parent == unorganized_dir and self.shard_threshold and not dest_path.exists():
+                # Only files actually placed flat count towards the shard threshold
+                self._unorganized_count += 1
+            claimed[str(dest_path).casefold()] = file_path
 
             # Check if file would go to unorganized
             if 'unorganized' in dest_path.parts:
-                self.stats['unorganized'] += 1
+                self.stats.unorganized += 1
                 logger.warning(f"Insufficient metadata for {file_path.name}, moving to unorganized/")
             else:
-                self.stats['organized'] += 1
+                self.stats.organized += 1
+                # Queue album art if this file went to an organized album folder (not unorganized)
+                self.pending_album_art.append((file_path.parent, dest_path.parent))
 
-            # Display action
-            action_verb = "move" if self.move_files else "copy"
             if self.dry_run:
                 logger.info(f"[DRY RUN] Would {action_verb}: {file_path} -> {dest_path}")
-                # Also check for album art during dry run
-                if 'unorganized' not in dest_path.parts:
-                    source_dir = file_path.parent
-                    dest_album_dir = dest_path.parent
-                    self.copy_album_art(source_dir, dest_album_dir)
             else:
-                # Create destination directory
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                transfers.append((file_path, dest_path))
 
-                # Move or copy file
-                if self.move_files:
-                    shutil.move(str(file_path), str(dest_path))
-                    logger.info(f"Moved: {file_path} -> {dest_path}")
-                else:
-                    shutil.copy2(str(file_path), str(dest_path))
-                    logger.info(f"Copied: {file_path} -> {dest_path}")
+        self.pending_transfers = []
+        return transfers
+
+    def _claim_content(self, file_path: Path, size: int) -> Optional[Path]:
+        """
+        Record a source's content, or find the earlier source it duplicates.
+
+        Sources are first told apart by size and sampled digest; the full-content
+        hash is only computed for sources that match an earlier one on both.
+
+        Args:
+            file_path: Source path
+            size: Source size in bytes
+
+        Returns:
+            The canonical source with the same content, or None if this is the first
+        """
+        try:
+            sample_key = (size, _sample_digest(file_path))
+            first = self._seen_samples.setdefault(sample_key, file_path)
+            if first == file_path:
+                return None
+            if first is not None:
+                # The first source is only hashed once a second one matches its sample
+                self._seen_hashes.setdefault(_content_hash(first), first)
+                self._seen_samples[sample_key] = None
+            content_hash = _content_hash(file_path)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not hash {file_path}: {e}")
+            return None
+        canonical = self._seen_hashes.get(content_hash)
+        if canonical is None:
+            self._seen_hashes[content_hash] = file_path
+        return canonical
+
+    def _resolve_collision(self, file_path: Path, dest_path: Path,
+                           claimed: Dict[str, Path]) -> Optional[Path]:
+        """
+        Pick a free destination for a file, or detect that it is already there.
 
-                # Copy album art if this file went to an organized album folder (not unorganized)
-                if 'unorganized' not in dest_path.parts:
-                    source_dir = file_path.parent
-                    dest_album_dir = dest_path.parent
-                    self.copy_album_art(source_dir, dest_album_dir)
+        A skipped file is counted in the stats here: as skipped if it is in place
+        or its copy already exists, as a duplicate if a move would have to drop it.
 
+        Args:
+            file_path: Source path
+            dest_path: Destination dictated by the file's metadata
+            claimed: Destinations already claimed this run, case-folded so names that only
+                differ in case (one file on macOS/Windows) never get two claims
+
+        Returns:
+            Destination to use, or None if the file should be skipped
+        """
+        candidate = dest_path
+        suffix_number = 1
+        while True:
+            if str(candidate).casefold() in claimed:
+                # Identical sources were already dropped by claim_transfers(), so this one differs
+                pass
+            elif candidate.exists():
+                if _same_file(file_path, candidate):
+                    logger.info(f"File already in correct location: {file_path}")
+                    self.stats.skipped += 1
+                    return None
+                if _same_content(file_path, candidate):
+                    if self.move_files:
+                        # Like a duplicate of another source, it stays where it is
+                        logger.info(f"Duplicate of {candidate}, skipping: {file_path}")
+                        self.stats.duplicates += 1
+                    else:
+                        logger.info(f"File already exists at destination, skipping: {candidate}")
+                        self.stats.skipped += 1
+                    return None
+            else:
+                return candidate
+
+            suffix_number += 1
+            candidate = dest_path.with_name(f"{dest_path.stem} ({suffix_number}){dest_path.suffix}")
+
+    def transfer_file(self, file_path: Path, dest_path: Path) -> bool:
+        """
+        Copy or move a single file to its destination.
+
+        Args:
+            file_path: Path to music file
+            dest_path: Destination path
+
+        Returns:
+            True if the file was transferred, False on error
+        """
+        try:
+            # Create destination directory
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Move or copy file
+            if self.move_files:
+                shutil.move(str(file_path), str(dest_path), copy_function=self.copy_function)
+                logger.info(f"Moved: {file_path} -> {dest_path}")
+            else:
+                self.copy_function(str(file_path), str(dest_path))
+                logger.info(f"Copied: {file_path} -> {dest_path}")
             return True
 
         except Exception as e:
             logger.error(f"Error organizing {file_path}: {e}")
-            self.stats['errors'] += 1
             return False
 
-    def find_audio_files(self) -> List[Path]:
+    async def transfer_files_async(self, transfers: List[Tuple[Path, Path]]) -> int:
+        """
+        Run transfers concurrently so many copies are in flight against the filesystem.
+
+        Args:
+            transfers: List of (source, destination) pairs
+
+        Returns:
+            Number of transfers that failed
+        """
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TRANSFERS) as executor:
+            results = await asyncio.gather(*(
+                loop.run_in_executor(executor, self.transfer_file, file_path, dest_path)
+                for file_path, dest_path in transfers
+            ))
+        return results.count(False)
+
+    def find_audio_files(self) -> Iterator[str]:
         """
         Recursively find all audio files in source directory.
         Skips the 'unorganized' folder to avoid reprocessing files.
 
+        Uses os.scandir directly so directory entries are classified from the
+        readdir results without a stat or Path object per file, and extensions
+        are matched with a single str.endswith call.
+
+        Yields:
+            Audio file paths as strings
+        """
+        pending_dirs = [str(self.source_dir)]
+        while pending_dirs:
+            current_dir = pending_dirs.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Skip the unorganized directory to avoid reprocessing files
+                            if entry.name != 'unorganized':
+                                pending_dirs.append(entry.path)
+                        elif entry.name.lower().endswith(AUDIO_SUFFIXES):
+                            yield entry.path
+            except OSError as e:
+                logger.warning(f"Error scanning {current_dir}: {e}")
+
+    def map_files(self, method_name: str, items: List, description: str, prefetch: bool = False) -> List:
+        """
+        Apply an organizer method to every item, fanning out to worker processes
+        when there is enough work. Stats recorded by the workers are merged here.
+
+        Args:
+            method_name: Name of the MusicOrganizer method to call per item
+            items: Picklable arguments, one per call
+            description: Label for the periodic progress log line
+            prefetch: If True, items are file paths whose headers run_batch() reads ahead
+
         Returns:
-            List of audio file paths
+            List of results, in no particular order
+        """
+        results = []
+        if self.workers > 1 and len(items) > 1:
+            # Each worker call handles a batch, so it can read ahead within the batch
+            batch_size = max(1, min(32, len(items) // (self.workers * 4)))
+            batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+            # Workers send their log records back over a process-safe queue
+            log_queue = multiprocessing.Queue(LOG_QUEUE_SIZE)
+            listener = logging.handlers.QueueListener(log_queue, *_log_handlers, respect_handler_level=True)
+            listener.start()
+            try:
+                with multiprocessing.Pool(self.workers, initializer=_init_worker,
+                                          initargs=(self.worker_config(), self.acoustid_bucket,
+                                                    log_queue, logger.level)) as pool:
+                    worker = functools.partial(_worker_batch, method_name, prefetch=prefetch)
+                    for batch_results, stats in pool.imap_unordered(worker, batches):
+                        self._merge_stats(stats)
+                        results.extend(batch_results)
+                        self._log_progress(description, len(results) - len(batch_results),
+                                           len(results), len(items))
+                    # Let workers exit normally so their queued log records are flushed
+                    pool.close()
+                    pool.join()
+            finally:
+                listener.stop()
+            return results
+
+        for i in range(0, len(items), PROGRESS_LOG_INTERVAL):
+            results.extend(self.run_batch(method_name, items[i:i + PROGRESS_LOG_INTERVAL], prefetch))
+            self._log_progress(description, i, len(results), len(items))
+        return results
+
+    def run_batch(self, method_name: str, items: List, prefetch: bool = False) -> List:
+        """
+        Apply an organizer method to items in order. With prefetch, a helper thread
+        warms the page cache with the headers of the next PREFETCH_DEPTH files, so
+        the next file's disk read overlaps the current file's tag parsing.
+
+        Args:
+            method_name: Name of the MusicOrganizer method to call per item
+            items: Arguments, one per call; file paths if prefetch is set
+            prefetch: If True, read ahead the headers of upcoming files
+
+        Returns:
+            List of results, in item order
+        """
+        method = getattr(self, method_name)
+        if not prefetch:
+            return [method(item) for item in items]
+        results = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            prefetches = deque(executor.submit(_warm_header, path) for path in items[:PREFETCH_DEPTH])
+            for i, item in enumerate(items):
+                # Keep at most PREFETCH_DEPTH files in flight ahead of the current one
+                prefetches.popleft().result()
+                if i + PREFETCH_DEPTH < len(items):
+                    prefetches.append(executor.submit(_warm_header, items[i + PREFETCH_DEPTH]))
+                results.append(method(item))
+        return results
+
+    def _log_progress(self, description: str, previous: int, done: int, total: int) -> None:
+        """
+        Log one progress line each time another PROGRESS_LOG_INTERVAL files finish, and at the end.
+
+        Args:
+            description: What is being done to the files
+            previous: Files finished before the latest batch
+            done: Files finished so far
+            total: Total number of files
         """
-        audio_files = []
-        for root, dirs, files in os.walk(self.source_dir):
-            # Skip the unorganized directory to avoid reprocessing files
-            dirs[:] = [d for d in dirs if d != 'unorganized']
+        if done // PROGRESS_LOG_INTERVAL > previous // PROGRESS_LOG_INTERVAL or done == total:
+            logger.info(f"{description}: {done}/{total} files")
 
-            for file in files:
-                file_path = Path(root) / file
-                if file_path.suffix.lower() in AUDIO_EXTENSIONS:
-                    audio_files.append(file_path)
+    def scan(self) -> List[str]:
+        """
+        Phase 1: find all audio files without reading them.
+
+        Returns:
+            List of audio file paths
+        """
+        logger.info("Scanning for audio files...")
+        audio_files = list(self.find_audio_files())
+        self.stats.total_files = len(audio_files)
+        logger.info(f"Found {len(audio_files)} audio files")
         return audio_files
 
+    def extract_tags(self, audio_files: List[str]) -> List[Tuple[str, Dict[str, str], int]]:
+        """
+        Phase 2: read the tags of every file across the worker pool.
+
+        Args:
+            audio_files: Audio file paths from scan()
+
+        Returns:
+            List of (file_path, metadata, file_size) records
+        """
+        return [record for record in self.map_files('read_file_tags', audio_files, "Reading tags", prefetch=True) if record is not None]
+
+    def resolve_fingerprints(self, records: List[Tuple[str, Dict[str, str], int]]) -> None:
+        """
+        Phase 3: identify files with insufficient tags via AcoustID, then resolve
+        their albums in a MusicBrainz batch. Record metadata is updated in place.
+
+        Args:
+            records: Records from extract_tags()
+        """
+        if not self.acoustid_api_key:
+            logger.debug("AcoustID API key not provided, skipping acoustic fingerprinting")
+            return
+
+        incomplete = {
+            file_path: metadata for file_path, metadata, _ in records
+            if not all(k in metadata for k in ['artist', 'album', 'title'])
+        }
+        candidates = [(file_path, file_size) for file_path, _, file_size in records if file_path in incomplete]
+
+        for file_path, acoustid_metadata in self.map_files('identify_file', candidates, "Fingerprinting"):
+            if not acoustid_metadata:
+                continue
+            metadata = incomplete[file_path]
+            recording_id = acoustid_metadata.pop('recording_id', None)
+            cache_key = acoustid_metadata.pop('cache_key', None)
+            metadata.update(acoustid_metadata)
+            if recording_id:
+                self.pending_lookups.append((file_path, metadata, recording_id, cache_key))
+
+        self.resolve_pending_lookups()
+
+    def plan_moves(self, records: List[Tuple[str, Dict[str, str], int]]) -> List[Tuple[Path, Path]]:
+        """
+        Phase 4: decide where every file goes.
+
+        Records are planned in path order, since the workers return them in
+        completion order and the first claim on a name wins it.
+
+        Args:
+            records: Records from extract_tags(), with resolved metadata
+
+        Returns:
+            List of (source, destination) pairs to transfer
+        """
+        for file_path, metadata, _ in sorted(records, key=lambda record: record[0]):
+            self.plan_file(Path(file_path), metadata)
+        return self.claim_transfers()
+
+    def execute_plan(self, plan: List[Tuple[Path, Path]], resume: bool = False) -> None:
+        """
+        Phase 5: copy/move the planned files concurrently, then handle album art serially.
+
+        Args:
+            plan: (source, destination) pairs from plan_moves() or a saved plan
+            resume: If True, skip transfers an interrupted run already completed
+        """
+        if resume:
+            plan = [(file_path, dest_path) for file_path, dest_path in plan
+                    if not self._transfer_done(file_path, dest_path)]
+        if plan:
+            self.stats.errors += asyncio.run(self.transfer_files_async(plan))
+
+        for source_dir, dest_album_dir in self.pending_album_art:
+            self.copy_album_art(source_dir, dest_album_dir)
+        self.pending_album_art = []
+
+    def _transfer_done(self, file_path: Path, dest_path: Path) -> bool:
+        """
+        Check whether a planned transfer was completed by an interrupted run.
+
+        Args:
+            file_path: Source path
+            dest_path: Destination path
+
+        Returns:
+            True if the transfer does not need to run again
+        """
+        try:
+            if self.move_files:
+                return not file_path.exists() and dest_path.exists()
+            src_stat = file_path.stat()
+            dest_stat = dest_path.stat()
+        except OSError:
+            return False
+        # copy2 sets the modification time last, so a partial copy never matches
+        return dest_stat.st_size == src_stat.st_size and int(dest_stat.st_mtime) == int(src_stat.st_mtime)
+
+    def save_plan(self, plan: List[Tuple[Path, Path]]) -> None:
+        """
+        Persist the transfer plan so a crash mid-copy can resume without rescanning.
+
+        Args:
+            plan: (source, destination) pairs from plan_moves()
+        """
+        state = {
+            'source_dir': str(self.source_dir),
+            'dest_dir': str(self.dest_dir),
+            'move_files': self.move_files,
+            'stats': asdict(self.stats),
+            'transfers': [[str(file_path), str(dest_path)] for file_path, dest_path in plan],
+            'album_art': [[str(source_dir), str(dest_album_dir)]
+                          for source_dir, dest_album_dir in self.pending_album_art]
+        }
+        try:
+            self.plan_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.plan_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.plan_path)
+        except OSError as e:
+            logger.warning(f"Error saving plan to {self.plan_path}: {e}")
+
+    def load_plan(self) -> Optional[List[Tuple[Path, Path]]]:
+        """
+        Load the plan left behind by an interrupted run, restoring its stats and album art queue.
+
+        Returns:
+            List of (source, destination) pairs, or None if there is nothing to resume
+        """
+        if not self.plan_path.exists():
+            return None
+        try:
+            with open(self.plan_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable plan {self.plan_path}: {e}")
+            return None
+        if state.get('move_files') != self.move_files:
+            logger.warning(f"Ignoring plan {self.plan_path} saved for a different mode")
+            return None
+
+        self.stats = Stats(**state['stats'])
+        self.pending_album_art = [(Path(s), Path(d)) for s, d in state['album_art']]
+        return [(Path(s), Path(d)) for s, d in state['transfers']]
+
     def organize(self) -> None:
         """
         Main method to organize all music files.
+
+        Runs scan -> extract_tags -> resolve_fingerprints -> plan_moves -> execute_plan.
+        The plan is saved before any file is touched and removed once it has been
+        executed, so an interrupted run resumes at execute_plan.
         """
         logger.info(f"Starting music organization...")
         logger.info(f"Source: {self.source_dir}")
@@ -422,32 +1466,43 @@ class MusicOrganizer:
         if not self.dry_run:
             self.dest_dir.mkdir(parents=True, exist_ok=True)
 
-        # Find all audio files
-        logger.info("Scanning for audio files...")
-        audio_files = self.find_audio_files()
-        self.stats['total_files'] = len(audio_files)
-
-        logger.info(f"Found {len(audio_files)} audio files")
+        plan = None if self.dry_run else self.load_plan()
+        resume = plan is not None
+        if resume:
+            logger.info(f"Resuming interrupted run from {self.plan_path} ({len(plan)} planned transfers)")
+        else:
+            audio_files = self.scan()
+            records = self.extract_tags(audio_files)
+            self.resolve_fingerprints(records)
+            plan = self.plan_moves(records)
+            if plan:
+                self.save_plan(plan)
+
+        self.execute_plan(plan, resume=resume)
+        # A dry run never loads the plan, so it must not discard one left by an interrupted run
+        if not self.dry_run and self.plan_path.exists():
+            self.plan_path.unlink()
+
+        # Print summary once all log output is out, so the two don't interleave
+        flush_logs()
+        self.print_summary()
 
-        # Process each file
-        for file_path in audio_files:
-            self.organize_file(file_path)
+    def _merge_stats(self, stats: Stats) -> None:
+        """
+        Fold the stats recorded by a worker process into this organizer's stats.
 
-        # Print summary
-        self.print_summary()
+        Args:
+            stats: Stats delta returned by _worker_batch
+        """
+        self.stats += stats
 
     def print_summary(self) -> None:
         """Print summary statistics."""
         print("\n" + "="*60)
         print("ORGANIZATION SUMMARY")
         print("="*60)
-        print(f"Total files processed: {self.stats['total_files']}")
-        print(f"Successfully organized: {self.stats['organized']}")
-        print(f"Moved to unorganized/: {self.stats['unorganized']}")
-        print(f"Already in correct location (skipped): {self.stats['skipped']}")
-        print(f"Album art copied: {self.stats['album_art_copied']}")
-        print(f"Metadata found via AcoustID: {self.stats['metadata_found']}")
-        print(f"Errors: {self.stats['errors']}")
+        for f in fields(Stats):
+            print(f"{f.metadata['label']}: {getattr(self.stats, f.name)}")
         print("="*60)
 
         if self.dry_run:
@@ -461,6 +1516,45 @@ class MusicOrganizer:
         print()
 
 
+# Organizer instance owned by each worker process, built once by _init_worker
+_worker_organizer: Optional[MusicOrganizer] = None
+
+
+def _init_worker(config: Dict, acoustid_bucket: TokenBucket, log_queue, log_level: int) -> None:
+    """
+    Initialize a worker process with its own organizer.
+
+    Args:
+        config: Keyword arguments from MusicOrganizer.worker_config()
+        acoustid_bucket: Rate limiter shared by all workers for AcoustID requests
+        log_queue: multiprocessing.Queue drained by a listener in the parent process
+        log_level: Level of the module logger in the parent process
+    """
+    global _worker_organizer
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.handlers = [_BlockingQueueHandler(log_queue)]
+    logger.setLevel(log_level)
+    _worker_organizer = MusicOrganizer(**config, acoustid_bucket=acoustid_bucket)
+
+
+def _worker_batch(method_name: str, items: List, prefetch: bool = False):
+    """
+    Run a batch of organizer method calls in a worker process.
+
+    Args:
+        method_name: Name of the MusicOrganizer method to call
+        items: Arguments, one per call
+        prefetch: Passed on to run_batch()
+
+    Returns:
+        (results, stats) pair where stats is the delta recorded by this batch
+    """
+    organizer = _worker_organizer
+    organizer.stats = Stats()
+    return organizer.run_batch(method_name, items, prefetch), organizer.stats
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -497,11 +1591,37 @@ Examples:
         help='Move files instead of copying (for in-place reorganization)'
     )
 
+    parser.add_argument(
+        '--reflink',
+        action='store_true',
+        help='Clone files instead of copying their data on copy-on-write filesystems (btrfs, XFS, ZFS)'
+    )
+
     parser.add_argument(
         '--acoustid-key',
         help='AcoustID API key for audio fingerprinting (get one at https://acoustid.org/api-key)'
     )
 
+    parser.add_argument(
+        '--acoustid-cache',
+        help=f'Path of the AcoustID lookup cache database (default: {DEFAULT_ACOUSTID_CACHE})'
+    )
+
+    parser.add_argument(
+        '--shard-threshold',
+        type=int,
+        default=DEFAULT_SHARD_THRESHOLD,
+        help=f'Put files into hashed unorganized/ab/cd/ subfolders once unorganized/ holds this many '
+             f'entries (default: {DEFAULT_SHARD_THRESHOLD}, 0 disables)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of worker processes (default: number of CPUs, 1 to process files serially)'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -511,6 +1631,7 @@ Examples:
     args = parser.parse_args()
 
     # Set logging level
+    listener = setup_logging()
     if args.verbose:
         logger.setLevel(logging.DEBUG)
 
@@ -520,10 +1641,17 @@ Examples:
         dest_dir=args.dest_dir,
         dry_run=args.dryrun,
         acoustid_api_key=args.acoustid_key,
-        move_files=args.move
+        move_files=args.move,
+        workers=args.workers,
+        acoustid_cache_path=args.acoustid_cache,
+        reflink=args.reflink,
+        shard_threshold=args.shard_threshold
     )
 
-    organizer.organize()
+    try:
+        organizer.organize()
+    finally:
+        listener.stop()
 
 
 if __name__ == '__main__':